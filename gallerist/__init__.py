@@ -1,5 +1,8 @@
 from .core import (
     Gallerist,
+    JpegTurboNotAvailableError,
+    OpenCVNotAvailableError,
+    assert_jpeg_turbo,
     ImageMetadata,
     ImageFormat,
     ImageVersion,
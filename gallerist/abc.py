@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Sequence, Tuple, Union
 
 
 class FileInfo:
@@ -28,10 +29,28 @@ class FileStore(ABC):
     async def write_file(self, file_path: str, data: bytes, info: FileInfo):
         """Writes a file to a given unique path"""
 
+    async def write_many(self, files: Sequence[Tuple[str, bytes, FileInfo]]):
+        """
+        Writes several files; by default files are written concurrently,
+        stores may override this method to batch writes.
+        """
+        await asyncio.gather(
+            *(self.write_file(file_path, data, info) for file_path, data, info in files)
+        )
+
     @abstractmethod
     async def delete_file(self, file_path: str):
         """Deletes a file"""
 
+    async def delete_many(self, file_paths: Sequence[str]):
+        """
+        Deletes several files; by default files are deleted concurrently,
+        stores may override this method to batch deletions.
+        """
+        await asyncio.gather(
+            *(self.delete_file(file_path) for file_path in file_paths)
+        )
+
 
 class SyncFileStore(ABC):
     """A store that operates on files synchronously."""
@@ -48,5 +67,10 @@ class SyncFileStore(ABC):
     def delete_file(self, file_path: str):
         """Deletes a file"""
 
+    def delete_many(self, file_paths: Sequence[str]):
+        """Deletes several files, stores may override this method to batch."""
+        for file_path in file_paths:
+            self.delete_file(file_path)
+
 
 FileStoreType = Union[FileStore, SyncFileStore]
@@ -1,11 +1,12 @@
 import os
-import uuid
 import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from io import BytesIO
 from asyncio import AbstractEventLoop
 from typing import Sequence, Optional, Dict, List, Generator
 from gallerist.abc import FileStoreType, FileStore, SyncFileStore, FileInfo
-from PIL import Image, ImageSequence
+from PIL import Image, ImageSequence, features
 
 
 def exception_str(ex):
@@ -17,6 +18,47 @@ def get_file_extension(file_path):
     return file_extension
 
 
+# modes converted to RGB before resizing and encoding; palette mode is not
+# included, to maintain PNG transparencies
+_NEEDS_RGB = frozenset({"CMYK", "YCbCr", "LAB", "HSV"})
+
+
+_EXT_TO_FORMAT = {
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+    ".png": "PNG",
+    ".gif": "GIF",
+}
+
+
+# formats that can carry more than one frame; anything else skips the
+# n_frames probe, which can hide seek work behind an attribute lookup
+_ANIMATED_FORMATS = frozenset({"GIF", "WEBP", "PNG"})
+
+
+def _is_animated(image) -> bool:
+    return (
+        image.format in _ANIMATED_FORMATS and getattr(image, "n_frames", 1) > 1
+    )
+
+
+_local_buffer = threading.local()
+
+
+def _get_buffer() -> BytesIO:
+    """
+    Returns a reusable per-thread buffer for encoding, so each encode only
+    allocates the final bytes object instead of a fresh BytesIO.
+    """
+    byte_io = getattr(_local_buffer, "byte_io", None)
+    if byte_io is None:
+        byte_io = _local_buffer.byte_io = BytesIO()
+    else:
+        byte_io.seek(0)
+        byte_io.truncate()
+    return byte_io
+
+
 class ImageWrapper:
 
     __slots__ = ("image", "frames")
@@ -25,35 +67,18 @@ class ImageWrapper:
         self.image = image
         self.frames = frames
 
-    @property
-    def n_frames(self):
-        if self.frames:
-            return len(self.frames)
-        # frames count can be known, while actual frames are not loaded in memory
-        return getattr(self.image, "n_frames", 1)
-
     @property
     def is_animated(self):
         return bool(self.frames)
 
-    @property
-    def info(self):
-        return self.image.info
-
-    @property
-    def format(self):
-        return self.image.format
-
-    @format.setter
-    def format(self, value):
-        self.image.format = value
-
     @classmethod
     def from_frames(cls, frames):
         return cls(frames[0], frames)
 
     def load_frames(self):
-        self.frames = list(ImageSequence.Iterator(self.image))
+        # the iterator yields the same, seeked image: frames must be copied
+        # to be kept in memory individually
+        self.frames = [frame.copy() for frame in ImageSequence.Iterator(self.image)]
 
 
 class ImageFormat:
@@ -71,13 +96,14 @@ class ImageFormat:
 
     def to_bytes(self, wrapper: ImageWrapper) -> bytes:
         image = wrapper.image
-        byte_io = BytesIO()
+        byte_io = _get_buffer()
+        # an empty exif strips any EXIF carried over from the source in
+        # image.info, without copying pixels; rotation is already applied
         if self.quality > 0:
-            image.save(byte_io, image.format, quality=self.quality)
+            image.save(byte_io, image.format, quality=self.quality, exif=b"")
         else:
-            image.save(byte_io, image.format)
-        byte_io.seek(0)
-        return byte_io.read()
+            image.save(byte_io, image.format, exif=b"")
+        return byte_io.getvalue()
 
 
 class JpegFormat(ImageFormat):
@@ -91,8 +117,21 @@ class PJpegFormat(ImageFormat):
 
 
 class PngFormat(ImageFormat):
-    def __init__(self):
+    def __init__(self, compress_level: int = 6):
         super().__init__("image/png", "PNG", ".png", -1)
+        # zlib effort, 0-9; the default matches Pillow, 1 trades some output
+        # size for much faster encoding
+        self.compress_level = compress_level
+
+    def to_bytes(self, wrapper: ImageWrapper) -> bytes:
+        byte_io = _get_buffer()
+        wrapper.image.save(
+            byte_io,
+            self.name,
+            compress_level=self.compress_level,
+            exif=b"",
+        )
+        return byte_io.getvalue()
 
 
 class MpoFormat(ImageFormat):
@@ -101,36 +140,71 @@ class MpoFormat(ImageFormat):
 
 
 class GifFormat(ImageFormat):
-    def __init__(self):
+    def __init__(self, optimize: bool = True):
         super().__init__("image/gif", "GIF", ".gif", -1)
+        # palette optimization shrinks output but costs a second encoding
+        # pass; disable it to favour speed over size
+        self.optimize = optimize
 
     def to_bytes(self, wrapper: ImageWrapper) -> bytes:
-        if wrapper.n_frames == 1:
-            return super().to_bytes(wrapper)
-        byte_io = BytesIO()
-
         if not wrapper.frames:
-            wrapper.load_frames()
+            image = wrapper.image
+            if not _is_animated(image):
+                return super().to_bytes(wrapper)
+            # unresized animated source: Pillow seeks and streams the frames
+            # itself, no in-memory frame list is materialized
+            byte_io = _get_buffer()
+            image.save(
+                byte_io, format=self.name, optimize=self.optimize, save_all=True
+            )
+            return byte_io.getvalue()
+        byte_io = _get_buffer()
 
         wrapper.frames[0].save(
             byte_io,
             format=self.name,
-            optimize=True,
+            optimize=self.optimize,
             save_all=True,
             append_images=wrapper.frames[1:],
-            duration=wrapper.info.get("duration", 100),
+            duration=wrapper.image.info.get("duration", 100),
             loop=0,
         )
-        byte_io.seek(0)
-        return byte_io.read()
+        return byte_io.getvalue()
+
+
+def _formats_maps(formats: Sequence[ImageFormat]):
+    # first format wins when several share the same name or mime
+    # (e.g. JPEG is the name of the jpeg, pjpeg and mpo formats)
+    by_mime = {}
+    by_name = {}
+    for handled_format in formats:
+        by_mime.setdefault(handled_format.mime, handled_format)
+        by_name.setdefault(handled_format.name, handled_format)
+    return by_mime, by_name
+
+
+# formats are stateless after construction: a single shared tuple serves
+# every Gallerist instance using the defaults, with its lookup maps built once
+_DEFAULT_FORMATS = (
+    JpegFormat(),
+    PJpegFormat(),
+    PngFormat(),
+    GifFormat(),
+    MpoFormat(),
+)
+
+_DEFAULT_FORMATS_BY_MIME, _DEFAULT_FORMATS_BY_NAME = _formats_maps(_DEFAULT_FORMATS)
 
 
 class ImageSize:
-    __slots__ = ("name", "resize_to")
+    __slots__ = ("name", "resize_to", "resample")
 
-    def __init__(self, name: str, resize_to: int):
+    def __init__(self, name: str, resize_to: int, resample: Optional[int] = None):
         self.name = name
         self.resize_to = resize_to
+        # optional Pillow resampling filter; None means Image.LANCZOS, small
+        # sizes can use a cheaper filter such as Image.BICUBIC
+        self.resample = resample
 
     def to_dict(self):
         return {"name": self.name, "resize_to": self.resize_to}
@@ -144,13 +218,21 @@ ImageSizesType = Dict[str, Sequence[ImageSize]]
 
 class ImageVersion:
 
-    __slots__ = ("size_name", "id", "max_side", "file_name")
+    __slots__ = ("size_name", "id", "max_side", "file_name", "resample")
 
-    def __init__(self, size_name: str, id: str, max_side: int, file_name: str = None):
+    def __init__(
+        self,
+        size_name: str,
+        id: str,
+        max_side: int,
+        file_name: str = None,
+        resample: Optional[int] = None,
+    ):
         self.size_name = size_name
         self.id = id
         self.max_side = max_side
         self.file_name = file_name
+        self.resample = resample
 
     def to_dict(self):
         return {
@@ -267,6 +349,34 @@ class SourceImageNotFoundError(GalleristError):
         super().__init__("The source image was not found, or could not be loaded.")
 
 
+class OpenCVNotAvailableError(GalleristError):
+    def __init__(self):
+        super().__init__(
+            "The `opencv` resize backend requires the opencv-python and "
+            "numpy packages."
+        )
+
+
+class JpegTurboNotAvailableError(GalleristError):
+    def __init__(self):
+        super().__init__(
+            "The installed Pillow is not linked against libjpeg-turbo; "
+            "JPEG encoding and decoding run on the slow code path. "
+            "Install Pillow-SIMD built against libjpeg-turbo, or a Pillow "
+            "build that bundles it."
+        )
+
+
+def assert_jpeg_turbo():
+    """
+    Raises an exception if the installed Pillow is not linked against
+    libjpeg-turbo; useful to fail loudly at startup in deployments that
+    rely on fast JPEG encoding and decoding.
+    """
+    if not features.check_feature("libjpeg_turbo"):
+        raise JpegTurboNotAvailableError()
+
+
 class Gallerist:
     """
     Provides methods to prepare images in various sizes and store them with metadata.
@@ -277,30 +387,83 @@ class Gallerist:
         store: FileStoreType,
         sizes: Optional[ImageSizesType] = None,
         formats: Optional[Sequence[ImageFormat]] = None,
+        max_workers: Optional[int] = None,
+        backend: str = "pillow",
+        pool_type: str = "process",
     ):
+        """
+        Creates a new instance of Gallerist, with a given store, and optional
+        sizes and formats configuration.
+
+        :param store: the file store used to read sources and write versions.
+        :param sizes: image sizes by mime type ('*' matches any other mime).
+        :param formats: handled image formats.
+        :param max_workers: if greater than one, resize and encode versions of
+            single frame images in a process pool of this many workers; both
+            the instance and its store must be picklable in this case.
+        :param backend: resize backend, either 'pillow' (default) or 'opencv';
+            the latter requires the optional opencv-python and numpy packages
+            and applies to single frame RGB, RGBA and grayscale images.
+        :param pool_type: kind of pool used with max_workers: 'process'
+            (default) or 'thread'; threads avoid pickling the image and store,
+            and still scale because Pillow releases the GIL while resampling
+            and encoding.
+        """
         self._sizes = None
+        self._executor = None
         self.store = store
         self.formats = formats or self.default_formats
         self.sizes = sizes or self.default_sizes
+        self.max_workers = max_workers
+        self.backend = backend
+        self.pool_type = pool_type
 
     default_sizes = {
         "*": (ImageSize("medium", 1200), ImageSize("thumbnail", 200)),
         "image/gif": (ImageSize("medium", 200), ImageSize("thumbnail", 120)),
     }
 
-    default_formats = [
-        JpegFormat(),
-        PJpegFormat(),
-        PngFormat(),
-        GifFormat(),
-        MpoFormat(),
-    ]
+    default_formats = _DEFAULT_FORMATS
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # executors cannot be pickled to worker processes
+        state["_executor"] = None
+        return state
+
+    def _get_executor(self) -> Optional[Executor]:
+        if not self.max_workers or self.max_workers < 2:
+            return None
+        if self._executor is None:
+            executor_type = (
+                ThreadPoolExecutor
+                if self.pool_type == "thread"
+                else ProcessPoolExecutor
+            )
+            self._executor = executor_type(max_workers=self.max_workers)
+        return self._executor
+
+    def close(self):
+        """Disposes of the worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @property
+    def formats(self):
+        return self._formats
+
+    @formats.setter
+    def formats(self, value: Sequence[ImageFormat]):
+        self._formats = value
+        if value is _DEFAULT_FORMATS:
+            self._formats_by_mime = _DEFAULT_FORMATS_BY_MIME
+            self._formats_by_name = _DEFAULT_FORMATS_BY_NAME
+        else:
+            self._formats_by_mime, self._formats_by_name = _formats_maps(value)
 
     def is_handled_mime(self, mime_type: str):
-        for handled_format in self.formats:
-            if handled_format.mime == mime_type:
-                return True
-        return False
+        return mime_type in self._formats_by_mime
 
     @property
     def sizes(self):
@@ -308,18 +471,18 @@ class Gallerist:
 
     @sizes.setter
     def sizes(self, value: Optional[ImageSizesType]):
-        for key, items in value.items():
-            value[key] = sorted(items, key=lambda x: x.resize_to, reverse=True)
-
-        self._sizes = value
+        # sort once at configuration time, without mutating the caller's dict
+        self._sizes = {
+            key: tuple(sorted(items, key=lambda item: item.resize_to, reverse=True))
+            for key, items in value.items()
+        }
+        self._default_sizes = self._sizes.get("*")
 
     def sizes_for_mime(self, image_mime: str) -> Sequence[ImageSize]:
-        if image_mime in self.sizes:
-            yield from self.sizes[image_mime]
-        elif "*" in self.sizes:
-            yield from self.sizes["*"]
-        else:
+        sizes = self._sizes.get(image_mime) or self._default_sizes
+        if sizes is None:
             raise SizesNotConfiguredForMimeError(image_mime)
+        return sizes
 
     def get_format(self, image: Image, image_format: Optional[str]) -> ImageFormat:
         if not image_format:
@@ -330,81 +493,132 @@ class Gallerist:
 
         image_format = image_format.upper()
 
-        for handled_format in self.formats:
-            if handled_format.name == image_format:
-                return handled_format
-
-        raise FormatNotConfiguredWithNameError(image_format)
+        try:
+            return self._formats_by_name[image_format]
+        except KeyError:
+            raise FormatNotConfiguredWithNameError(image_format)
 
     def format_by_mime(self, image_mime: str) -> ImageFormat:
-        for handled_format in self.formats:
-            if handled_format.mime == image_mime:
-                return handled_format
-        raise FormatNotConfiguredForMimeError(image_mime)
+        try:
+            return self._formats_by_mime[image_mime]
+        except KeyError:
+            raise FormatNotConfiguredForMimeError(image_mime)
 
     def new_id(self) -> str:
-        return str(uuid.uuid4()).replace("-", "")
+        return os.urandom(16).hex()
 
     def get_extension_by_mime(self, mime: str):
-        for handled_format in self.formats:
-            if handled_format.mime == mime:
-                return handled_format.extension
+        handled_format = self._formats_by_mime.get(mime)
+        if handled_format is not None:
+            return handled_format.extension
         raise ValueError(
             f"Type `{mime}` is not handled by this instance "
             f"of {self.__class__.__name__}"
         )
 
-    def auto_rotate(self, img: Image) -> Image:
+    def auto_rotate(self, img: Image):
+        """
+        Rotates an image according to its EXIF orientation, returning the
+        image and whether a 90° or 270° rotation swapped its sides.
+        """
+        # info is populated while reading the header: when no raw EXIF
+        # payload was found there, skip parsing EXIF tags entirely
+        if "exif" not in img.info:
+            return img, False
+
         exif = img.getexif() if hasattr(img, "getexif") else None
 
         if not exif:
-            return img
+            return img, False
 
         orientation_key = 274  # cf ExifTags
         if orientation_key in exif:
             orientation = exif[orientation_key]
 
-            rotate_values = {3: 180, 6: 270, 8: 90}
-
-            if orientation in rotate_values:
-                return img.rotate(rotate_values[orientation], expand=True)
-        return img
+            # lossless block transposes, cheaper than a generic rotation;
+            # they run after draft scaling, so large JPEG sources are never
+            # rotated at full resolution
+            transpose_values = {
+                2: Image.FLIP_LEFT_RIGHT,
+                3: Image.ROTATE_180,
+                4: Image.FLIP_TOP_BOTTOM,
+                5: Image.TRANSPOSE,
+                6: Image.ROTATE_270,
+                7: Image.TRANSVERSE,
+                8: Image.ROTATE_90,
+            }
+
+            if orientation in transpose_values:
+                return (
+                    img.transpose(transpose_values[orientation]),
+                    orientation in (5, 6, 7, 8),
+                )
+        return img, False
 
     def _verify_mode_and_rotation(self, image: Image):
         if image.format == "GIF":
-            return image
+            return image, False
 
-        if image.mode == "CMYK":
+        if image.mode in _NEEDS_RGB:
             image = image.convert("RGB")
 
         return self.auto_rotate(image)
 
-    def resize_to_max_side(self, image: Image, desired_max_side: int) -> ImageWrapper:
+    def _opencv_resize(self, image: Image, sc) -> Image:
+        """
+        Downscales a single frame image with OpenCV INTER_AREA, typically
+        faster than Pillow Lanczos at comparable quality; encoding still goes
+        through Pillow.
+        """
+        try:
+            import cv2
+            import numpy
+        except ImportError as import_error:
+            raise OpenCVNotAvailableError() from import_error
+
+        array = cv2.resize(numpy.asarray(image), sc, interpolation=cv2.INTER_AREA)
+        return Image.fromarray(array, image.mode)
+
+    def resize_to_max_side(
+        self,
+        image: Image,
+        desired_max_side: int,
+        resample: Optional[int] = None,
+    ) -> ImageWrapper:
         width, height = image.size
 
         max_side = max(width, height)
 
         if max_side <= desired_max_side:
-            # return the same image
+            # return the same image without loading frames: for animated
+            # images the encode step streams frames straight from the source
             return ImageWrapper(image)
 
+        # integer ratio math with round-half-up, avoiding float division and
+        # the 1-pixel drift of truncation across successive sizes
         if width >= height:
             # h : 100 = w : x
-            ratio = width / desired_max_side
-            other_side = height / ratio
-            sc = (desired_max_side, int(other_side))
+            sc = (desired_max_side, (height * desired_max_side + width // 2) // width)
         else:
             # w : 100 = h : x
-            ratio = height / desired_max_side
-            other_side = width / ratio
-            sc = (int(other_side), desired_max_side)
-
-        if getattr(image, "n_frames", 1) == 1:
-            # single frame image
-            return ImageWrapper(image.resize(sc, Image.ANTIALIAS))
+            sc = ((width * desired_max_side + height // 2) // height, desired_max_side)
+
+        if not _is_animated(image):
+            if self.backend == "opencv" and image.mode in ("RGB", "RGBA", "L"):
+                return ImageWrapper(self._opencv_resize(image, sc))
+            # single frame image; reducing_gap applies a cheap box pre-reduction
+            # so the filter only resamples an already-small intermediate
+            return ImageWrapper(
+                image.resize(sc, resample or Image.LANCZOS, reducing_gap=3.0)
+            )
 
+        # nearest neighbour is much cheaper than a box filter on palette
+        # frames, and palette output cannot render smooth gradients anyway
         return ImageWrapper.from_frames(
-            [frame.resize(sc, Image.BOX) for frame in ImageSequence.Iterator(image)]
+            [
+                frame.resize(sc, Image.NEAREST if frame.mode == "P" else Image.BOX)
+                for frame in ImageSequence.Iterator(image)
+            ]
         )
 
     def process_image(self, source_image_path: str):
@@ -421,24 +635,39 @@ class Gallerist:
             image, self.format_by_extension(source_image_path) or "JPEG"
         )
 
-        metadata = self._generate_images(image, image_format)
+        metadata = self._generate_images(image, image_format, data)
 
         image.close()
         return metadata
 
+    def process_many(
+        self,
+        source_image_paths: Sequence[str],
+        max_workers: Optional[int] = None,
+    ) -> List[ImageMetadata]:
+        """
+        Processes several images concurrently, one per worker process,
+        returning metadata in input order; both the instance and its store
+        must be picklable. Independent images scale better across processes
+        than the per-version pool, since whole decode-resize-encode-write
+        pipelines run in parallel.
+
+        :param source_image_paths: paths of the source images.
+        :param max_workers: size of the process pool; defaults to the number
+            of CPUs.
+        """
+        if not isinstance(self.store, SyncFileStore):
+            raise ExpectedSyncStoreError()
+
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            return list(pool.map(self.process_image, source_image_paths))
+
     def get_image_name(self, version: ImageVersion, image_format: ImageFormat):
         return f"{version.size_name[0]}-{version.id}{image_format.extension}"
 
-    def format_by_extension(self, image_path):
-        extension = get_file_extension(image_path).lower()
-
-        if extension == ".jpg" or extension == ".jpeg":
-            return "JPEG"
-        if extension == ".png":
-            return "PNG"
-        if extension == ".gif":
-            return "GIF"
-        return None
+    @staticmethod
+    def format_by_extension(image_path):
+        return _EXT_TO_FORMAT.get(get_file_extension(image_path).lower())
 
     async def process_image_async(
         self,
@@ -463,50 +692,167 @@ class Gallerist:
         )
 
         metadata = await self._generate_images_async(
-            image, image_format, loop, executor
+            image, image_format, loop, executor, data
         )
 
         image.close()
         return metadata
 
     async def _generate_images_async(
-        self, image: Image, image_format: ImageFormat, loop: AbstractEventLoop, executor
+        self,
+        image: Image,
+        image_format: ImageFormat,
+        loop: AbstractEventLoop,
+        executor,
+        source_data: Optional[bytes] = None,
     ) -> ImageMetadata:
         metadata = self.get_metadata(image, image_format)
+        file_info = FileInfo(image_format.mime, image_format.extension)
 
+        pending_writes = []
+        source = image
         for version in self.get_versions(image_format.mime):
             image_name = self.get_image_name(version, image_format)
             version.file_name = image_name
             metadata.versions.append(version)
+
+            if self._use_source_bytes(
+                image, version.max_side, image_format, source_data
+            ):
+                # the source already fits this size: store it as-is
+                pending_writes.append((image_name, source_data, file_info))
+                continue
+
             resized_image = await loop.run_in_executor(
-                executor, self.resize_to_max_side, image, version.max_side
+                executor,
+                self.resize_to_max_side,
+                source,
+                version.max_side,
+                version.resample,
             )
-            resized_image.format = image_format.name
+            resized_image.image.format = image_format.name
 
-            await self.store.write_file(
-                image_name,
-                image_format.to_bytes(resized_image),
-                FileInfo(image_format.mime, image_format.extension),
+            if not resized_image.is_animated:
+                # versions are sorted by descending max side: resample the
+                # next, smaller size from this output, not the full source
+                source = resized_image.image
+
+            data = await loop.run_in_executor(
+                executor, image_format.to_bytes, resized_image
             )
+            pending_writes.append((image_name, data, file_info))
+
+        # write all versions at once: stores supporting batching (such as the
+        # io_uring store) submit them with a single syscall
+        if pending_writes:
+            await self.store.write_many(pending_writes)
 
         return metadata
 
+    def _use_source_bytes(
+        self,
+        image: Image,
+        max_side: int,
+        image_format: ImageFormat,
+        source_data: Optional[bytes],
+    ) -> bool:
+        """
+        Returns whether the original file contents can be stored for a version,
+        skipping a useless decode and re-encode round trip: possible when the
+        source pixels were not altered while parsing, the source already fits
+        the desired size, and the output format matches the source format.
+        """
+        # the comparison must use the format recorded while parsing: the
+        # versions loop rewrites image.format with the output format, and the
+        # no-resize branch returns the source image itself, so image.format
+        # would match after the first generated version (e.g. an MPO source
+        # would pass through as a JPEG version)
+        return (
+            source_data is not None
+            and not getattr(image, "source_modified", True)
+            and max(image.size) <= max_side
+            and getattr(image, "source_format", None) == image_format.name
+        )
+
+    def _resize_and_encode(
+        self,
+        image: Image,
+        max_side: int,
+        image_format: ImageFormat,
+        resample: Optional[int] = None,
+    ) -> bytes:
+        resized_image = self.resize_to_max_side(image, max_side, resample)
+        resized_image.image.format = image_format.name
+        return image_format.to_bytes(resized_image)
+
     def _generate_images(
-        self, image: Image, image_format: ImageFormat
+        self,
+        image: Image,
+        image_format: ImageFormat,
+        source_data: Optional[bytes] = None,
     ) -> ImageMetadata:
         metadata = self.get_metadata(image, image_format)
+        file_info = FileInfo(image_format.mime, image_format.extension)
 
+        versions = []
         for version in self.get_versions(image_format.mime):
-            image_name = self.get_image_name(version, image_format)
-            version.file_name = image_name
+            version.file_name = self.get_image_name(version, image_format)
             metadata.versions.append(version)
-            resized_image = self.resize_to_max_side(image, version.max_side)
-            resized_image.format = image_format.name
+            versions.append(version)
+
+        executor = self._get_executor()
+        if (
+            executor is not None
+            and len(versions) > 1
+            and not _is_animated(image)
+        ):
+            # resize and encode all versions concurrently, one per process;
+            # writes stay serial, keeping the store usage simple
+            futures = [
+                None
+                if self._use_source_bytes(
+                    image, version.max_side, image_format, source_data
+                )
+                else executor.submit(
+                    self._resize_and_encode,
+                    image,
+                    version.max_side,
+                    image_format,
+                    version.resample,
+                )
+                for version in versions
+            ]
+            for version, future in zip(versions, futures):
+                self.store.write_file(
+                    version.file_name,
+                    source_data if future is None else future.result(),
+                    file_info,
+                )
+            return metadata
+
+        source = image
+        for version in versions:
+            if self._use_source_bytes(
+                image, version.max_side, image_format, source_data
+            ):
+                # the source already fits this size: store it as-is
+                self.store.write_file(version.file_name, source_data, file_info)
+                continue
+
+            resized_image = self.resize_to_max_side(
+                source, version.max_side, version.resample
+            )
+            resized_image.image.format = image_format.name
+
+            if not resized_image.is_animated:
+                # versions are sorted by descending max side: resample the next,
+                # smaller size from this output instead of the full source
+                source = resized_image.image
 
             self.store.write_file(
-                image_name,
+                version.file_name,
                 image_format.to_bytes(resized_image),
-                FileInfo(image_format.mime, image_format.extension),
+                file_info,
             )
 
         return metadata
@@ -520,15 +866,54 @@ class Gallerist:
         :return: a sequence of ImageVersion
         """
         for size in self.sizes_for_mime(image_mime):
-            yield ImageVersion(size.name, self.new_id(), size.resize_to)
+            yield ImageVersion(
+                size.name, self.new_id(), size.resize_to, resample=size.resample
+            )
+
+    def _draft_decode(self, image: Image):
+        """
+        Configures the decoder to scale JPEG sources down during decode:
+        libjpeg can apply 1/2, 1/4, 1/8 IDCT scaling for a fraction of the
+        cost of decoding the full resolution. Twice the largest configured
+        size is kept, to leave enough resolution for the Lanczos pass.
+        """
+        if image.format not in ("JPEG", "MPO"):
+            return
+
+        try:
+            largest = max(
+                size.resize_to for size in self.sizes_for_mime("image/jpeg")
+            )
+        except SizesNotConfiguredForMimeError:
+            return
+
+        image.draft(None, (largest * 2, largest * 2))
 
     def parse_image(self, data: bytes) -> Image:
         image = Image.open(BytesIO(data))
-        image = self._verify_mode_and_rotation(image)
+        source_size = image.size
+        source_format = image.format
+        original = image
+        self._draft_decode(image)
+        image, sides_swapped = self._verify_mode_and_rotation(image)
+        # force a single decode here, so the versions loop reuses the
+        # decoded pixel buffer instead of decoding lazily more than once
+        image.load()
+
+        if sides_swapped:
+            source_size = source_size[::-1]
+        # keep the real source size for metadata, regardless of decoder scaling
+        image.source_size = source_size
+        # keep the decoder's format: the versions loop overwrites image.format
+        # with the output format before encoding
+        image.source_format = source_format
+        # remember whether conversion, rotation or decoder scaling altered the
+        # pixels, so unmodified sources can be written through as-is
+        image.source_modified = image is not original or image.size != source_size
         return image
 
     def get_metadata(self, image: Image, image_format: ImageFormat):
-        width, height = image.size
+        width, height = getattr(image, "source_size", image.size)
 
         return ImageMetadata(
             width, height, image_format.extension, image_format.mime, []
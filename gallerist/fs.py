@@ -1,5 +1,5 @@
 import os
-import aiofiles
+import asyncio
 from typing import Optional
 from gallerist.abc import FileStore, SyncFileStore, FileInfo
 
@@ -7,6 +7,16 @@ from gallerist.abc import FileStore, SyncFileStore, FileInfo
 __all__ = ("FileSystemFileStore", "FileSystemSyncFileStore")
 
 
+def _read_bytes(file_path: str) -> bytes:
+    with open(file_path, "rb") as file:
+        return file.read()
+
+
+def _write_bytes(file_path: str, data: bytes):
+    with open(file_path, "wb") as file:
+        file.write(data)
+
+
 class BaseFileSystemFileStore:
     def __init__(self, folder_name: Optional[str]):
         self.folder_name = folder_name
@@ -18,13 +28,19 @@ class BaseFileSystemFileStore:
 
 
 class FileSystemFileStore(FileStore, BaseFileSystemFileStore):
+    # whole files are read and written in one call, so a single executor hop
+    # per operation is cheaper than dispatching open, read and close
+    # separately to a background thread
+
     async def read_file(self, file_path: str) -> bytes:
-        async with aiofiles.open(self.full_path(file_path), mode="rb") as f:
-            return await f.read()
+        return await asyncio.get_event_loop().run_in_executor(
+            None, _read_bytes, self.full_path(file_path)
+        )
 
     async def write_file(self, file_path: str, data: bytes, info: FileInfo):
-        async with aiofiles.open(self.full_path(file_path), mode="wb") as f:
-            await f.write(data)
+        await asyncio.get_event_loop().run_in_executor(
+            None, _write_bytes, self.full_path(file_path), data
+        )
 
     async def delete_file(self, file_path: str):
         try:
@@ -35,12 +51,10 @@ class FileSystemFileStore(FileStore, BaseFileSystemFileStore):
 
 class FileSystemSyncFileStore(SyncFileStore, BaseFileSystemFileStore):
     def read_file(self, file_path: str) -> bytes:
-        with open(self.full_path(file_path), "rb") as file:
-            return file.read()
+        return _read_bytes(self.full_path(file_path))
 
     def write_file(self, file_path: str, data: bytes, info: FileInfo):
-        with open(self.full_path(file_path), "wb") as file:
-            file.write(data)
+        _write_bytes(self.full_path(file_path), data)
 
     def delete_file(self, file_path: str):
         try:
@@ -29,7 +29,11 @@ setup(
     keywords="pictures images web",
     license="MIT",
     packages=["gallerist"],
-    install_requires=["aiofiles>=0.4.0", "Pillow>=8.3.2"],
+    install_requires=["Pillow>=8.3.2"],
+    extras_require={
+        "iouring": ["liburing"],
+        "opencv": ["opencv-python", "numpy"],
+    },
     include_package_data=True,
     zip_safe=False,
 )
@@ -0,0 +1,15 @@
+import os
+import pytest
+from shutil import rmtree
+
+
+out_path = os.path.join("tests", "out") if os.path.isdir("tests") else "out"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def out_dir():
+    if os.path.exists(out_path):
+        rmtree(out_path)
+
+    os.makedirs(out_path, exist_ok=True)
+    yield
@@ -1,16 +1,14 @@
 import os
 import pytest
 import asyncio
-from shutil import rmtree
 from gallerist.core import Gallerist, FileStore, SyncFileStore, FileInfo, Image
 
 
-out_path = os.path.join("tests", "out") if os.path.isdir("tests") else "out"
+# whether tests run from the repository root; checked once instead of
+# stat-ing the folder on every store operation
+in_repo_root = os.path.isdir("tests")
 
-if os.path.exists(out_path):
-    rmtree(out_path)
-
-os.makedirs(out_path, exist_ok=True)
+out_path = os.path.join("tests", "out") if in_repo_root else "out"
 
 
 class FakeSyncStore(SyncFileStore):
@@ -18,7 +16,7 @@ class FakeSyncStore(SyncFileStore):
         self.folder_name = "out"
 
     def _check_tests_folder(self, full_path):
-        if os.path.isdir("tests"):
+        if in_repo_root:
             return os.path.join("tests", full_path)
         return full_path
 
@@ -80,6 +78,30 @@ async def test_prepare_for_web_async(file_path: str):
         image.close()
 
 
+@pytest.mark.asyncio
+async def test_prepare_for_web_async_batch():
+    gallerist = Gallerist(FakeStore())
+
+    file_paths = [
+        "files/pexels-photo-126407.jpeg",
+        "files/blacksheep.png",
+        "files/01.gif",
+        "files/small-png-01.png",
+    ]
+
+    all_metadata = await asyncio.gather(
+        *(gallerist.process_image_async(file_path) for file_path in file_paths)
+    )
+
+    for metadata in all_metadata:
+        assert metadata is not None
+
+        for version in metadata.versions:
+            image = Image.open(gallerist.store.full_path(version.file_name))
+            assert image is not None
+            image.close()
+
+
 @pytest.mark.parametrize(
     "file_path",
     [
@@ -102,6 +124,127 @@ def test_prepare_for_web_sync(file_path: str):
         image.close()
 
 
+@pytest.mark.parametrize(
+    "file_path",
+    [
+        "files/pexels-photo-126407.jpeg",
+        "files/blacksheep.png",
+    ],
+)
+def test_prepare_for_web_sync_opencv_backend(file_path: str):
+    pytest.importorskip("cv2")
+    gallerist = Gallerist(FakeSyncStore(), backend="opencv")
+
+    metadata = gallerist.process_image(file_path)
+
+    assert metadata is not None
+
+    for version in metadata.versions:
+        image = Image.open(gallerist.store.full_path(version.file_name))
+        assert image is not None
+        image.close()
+
+
+@pytest.mark.parametrize("pool_type", ["process", "thread"])
+def test_prepare_for_web_sync_with_pool(pool_type: str):
+    gallerist = Gallerist(FakeSyncStore(), max_workers=2, pool_type=pool_type)
+
+    try:
+        metadata = gallerist.process_image("files/pexels-photo-126407.jpeg")
+
+        assert metadata is not None
+        assert len(metadata.versions) == 2
+
+        for version in metadata.versions:
+            image = Image.open(gallerist.store.full_path(version.file_name))
+            assert image is not None
+            image.close()
+    finally:
+        gallerist.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "file_path",
+    [
+        "files/pexels-photo-126407.jpeg",
+        "files/blacksheep.png",
+    ],
+)
+async def test_prepare_for_web_io_uring(file_path: str):
+    pytest.importorskip("liburing")
+    from gallerist.iouring import IoUringFileStore
+
+    class IoUringTestStore(IoUringFileStore):
+        def full_path(self, file_path: str):
+            if file_path.startswith("files/"):
+                if in_repo_root:
+                    return os.path.join("tests", file_path)
+                return file_path
+            return os.path.join(out_path, file_path)
+
+    store = IoUringTestStore()
+    gallerist = Gallerist(store)
+
+    try:
+        metadata = await asyncio.wait_for(
+            gallerist.process_image_async(file_path), timeout=30
+        )
+
+        assert metadata is not None
+
+        for version in metadata.versions:
+            image = Image.open(store.full_path(version.file_name))
+            assert image is not None
+            image.close()
+    finally:
+        store.close()
+
+
+def test_process_many():
+    gallerist = Gallerist(FakeSyncStore())
+
+    file_paths = [
+        "files/pexels-photo-126407.jpeg",
+        "files/blacksheep.png",
+        "files/01.gif",
+        "files/small-png-01.png",
+    ]
+
+    all_metadata = gallerist.process_many(file_paths, max_workers=2)
+
+    assert len(all_metadata) == len(file_paths)
+
+    for metadata in all_metadata:
+        assert metadata is not None
+
+        for version in metadata.versions:
+            image = Image.open(gallerist.store.full_path(version.file_name))
+            assert image is not None
+            image.close()
+
+
+def test_small_mpo_versions_are_reencoded_as_jpeg():
+    # an MPO smaller than every configured size must not pass through as-is
+    # once the first generated version rewrites the source image's format
+    gallerist = Gallerist(FakeSyncStore())
+
+    first = Image.new("RGB", (100, 80), (255, 0, 0))
+    second = Image.new("RGB", (100, 80), (0, 255, 0))
+    first.save(os.path.join(out_path, "two-frames.mpo"), "MPO", append_images=[second])
+
+    metadata = gallerist.process_image("out/two-frames.mpo")
+
+    assert metadata is not None
+    assert len(metadata.versions) == 2
+
+    for version in metadata.versions:
+        image = Image.open(gallerist.store.full_path(version.file_name))
+        assert image.format == "JPEG"
+        assert getattr(image, "n_frames", 1) == 1
+        image.close()
+
+
 def test_cmyk_gets_converted_to_rgb():
     gallerist = Gallerist(FakeSyncStore())
 